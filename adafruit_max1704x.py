@@ -24,14 +24,13 @@ Implementation Notes
 * Adafruit CircuitPython firmware for the supported boards:
   https://circuitpython.org/downloads
 * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
-* Adafruit's Register library: https://github.com/adafruit/Adafruit_CircuitPython_Register
 """
 
+import struct
+import time
+
 from micropython import const
 from adafruit_bus_device import i2c_device
-from adafruit_register.i2c_struct import ROUnaryStruct, UnaryStruct
-from adafruit_register.i2c_bit import RWBit, ROBit
-from adafruit_register.i2c_bits import RWBits
 
 try:
     from busio import I2C
@@ -56,6 +55,50 @@ _MAX1704X_CHIPID_REG = const(0x19)
 _MAX1704X_STATUS_REG = const(0x1A)
 _MAX1704X_CMD_REG = const(0xFE)
 
+# Bit masks within the registers above
+_MAX1704X_MODE_QUICKSTART = const(0x40)  # high byte of MODE (0x06)
+_MAX1704X_MODE_ENSLEEP = const(0x20)
+_MAX1704X_MODE_HIBSTAT = const(0x10)
+_MAX1704X_CONFIG_SLEEP = const(0x0080)  # CONFIG word (0x0C)
+_MAX1704X_CONFIG_ALERT = const(0x0020)
+_MAX1704X_VRESET_DIS = const(0x01)  # VRESET/ID byte (0x18)
+
+# How long, in seconds, a sample() snapshot is considered fresh by the
+# cached properties before they fall back to reading the registers again
+_MAX1704X_SAMPLE_TTL = 0.5
+
+# Register LSB scale factors, precomputed once at import so the property
+# getters and setters don't redo the float math on every access
+# (micropython.const() only supports ints, so these are plain floats)
+_MAX1704X_VCELL_LSB = 78.125 / 1_000_000  # 78.125 uV per LSB
+_MAX1704X_CRATE_LSB = 0.208  # 0.208% per hour per LSB
+_MAX1704X_VRESET_LSB = 0.04  # 40mV per LSB
+_MAX1704X_VALRT_LSB = 0.02  # 20mV per LSB
+_MAX1704X_ACTTHR_LSB = 0.00125  # 1.25mV per LSB
+_MAX1704X_HIBTHR_LSB = 0.208  # 0.208% per hour per LSB
+# Fixed-point reciprocals of the writable LSBs for _quantize(). Each value
+# scale and reciprocal scale are chosen so their fractional bits total 16
+# while the product stays within viper's signed 32-bit ints
+_MAX1704X_INV_VRESET_LSB_Q8 = const(6400)  # (1 / 0.04) << 8, value is Q8
+_MAX1704X_INV_VALRT_LSB_Q8 = const(12800)  # (1 / 0.02) << 8, value is Q8
+_MAX1704X_INV_ACTTHR_LSB_Q4 = const(12800)  # (1 / 0.00125) << 4, value is Q12
+_MAX1704X_INV_HIBTHR_LSB_Q10 = const(4923)  # (1 / 0.208) << 10, value is Q6
+# Full-scale limits used by the setter range checks
+_MAX1704X_VRESET_MAX = 127 * _MAX1704X_VRESET_LSB
+_MAX1704X_VALRT_MAX = 255 * _MAX1704X_VALRT_LSB
+_MAX1704X_ACTTHR_MAX = 255 * _MAX1704X_ACTTHR_LSB
+_MAX1704X_HIBTHR_MAX = 255 * _MAX1704X_HIBTHR_LSB
+
+
+def _quantize(value: int, inv_lsb: int) -> int:
+    # value and inv_lsb are fixed point with fractional bits totalling 16,
+    # so the product is Q16; adding half an LSB before the shift rounds to
+    # nearest. Integer-only, so a downstream MicroPython build can compile
+    # it with the literal @micropython.viper decorator (the emitter is only
+    # engaged by that exact syntax and there is no runtime equivalent).
+    return (value * inv_lsb + 0x8000) >> 16
+
+
 ALERTFLAG_SOC_CHANGE = 0x20
 ALERTFLAG_SOC_LOW = 0x10
 ALERTFLAG_VOLTAGE_RESET = 0x08
@@ -64,160 +107,432 @@ ALERTFLAG_VOLTAGE_HIGH = 0x02
 ALERTFLAG_RESET_INDICATOR = 0x01
 
 
-class MAX17048:
+class MAX17048:  # pylint: disable=too-many-public-methods,too-many-instance-attributes
     """Driver for the MAX1704X battery fuel gauge.
     :param ~busio.I2C i2c_bus: The I2C bus the MAX1704X is connected to.
     :param address: The I2C device address. Defaults to :const:`0x36`
     """
 
-    chip_version = ROUnaryStruct(_MAX1704X_VERSION_REG, ">H")
-    chip_id = ROUnaryStruct(_MAX1704X_CHIPID_REG, ">B")
-
-    _config = ROUnaryStruct(_MAX1704X_CONFIG_REG, ">H")
-    # expose the config bits
-    sleep = RWBit(_MAX1704X_CONFIG_REG + 1, 7, register_width=2, lsb_first=False)
-    _alert_status = RWBit(
-        _MAX1704X_CONFIG_REG + 1, 5, register_width=2, lsb_first=False
-    )
-    enable_sleep = RWBit(_MAX1704X_MODE_REG, 5)
-    hibernating = ROBit(_MAX1704X_MODE_REG, 4)
-    quick_start = RWBit(_MAX1704X_MODE_REG, 6)
-
-    _cmd = UnaryStruct(_MAX1704X_CMD_REG, ">H")
-    _status = ROUnaryStruct(_MAX1704X_STATUS_REG, ">B")
-    _cell_voltage = ROUnaryStruct(_MAX1704X_VCELL_REG, ">H")
-    _cell_SOC = ROUnaryStruct(_MAX1704X_SOC_REG, ">H")
-    _cell_crate = ROUnaryStruct(_MAX1704X_CRATE_REG, ">h")
-    _vreset = ROUnaryStruct(_MAX1704X_VRESET_REG, ">B")
-    _hibrt_actthr = UnaryStruct(_MAX1704X_HIBRT_REG + 1, ">B")
-    _hibrt_hibthr = UnaryStruct(_MAX1704X_HIBRT_REG, ">B")
-    _valrt_min = UnaryStruct(_MAX1704X_VALERT_REG, ">B")
-    _valrt_max = UnaryStruct(_MAX1704X_VALERT_REG + 1, ">B")
-
-    # expose the alert bits
-    reset_alert = RWBit(_MAX1704X_STATUS_REG, 0)
-    voltage_high_alert = RWBit(_MAX1704X_STATUS_REG, 1)
-    voltage_low_alert = RWBit(_MAX1704X_STATUS_REG, 2)
-    voltage_reset_alert = RWBit(_MAX1704X_STATUS_REG, 3)
-    SOC_low_alert = RWBit(_MAX1704X_STATUS_REG, 4)
-    SOC_change_alert = RWBit(_MAX1704X_STATUS_REG, 5)
-
-    _reset_voltage = RWBits(7, _MAX1704X_VRESET_REG, 1)
-    comparator_disabled = RWBit(_MAX1704X_VRESET_REG, 0)
-
     def __init__(self, i2c_bus: I2C, address: int = MAX1704X_I2CADDR_DEFAULT) -> None:
         # pylint: disable=no-member
         self.i2c_device = i2c_device.I2CDevice(i2c_bus, address)
-
-        if self.chip_version & 0xFFF0 != 0x0010:
+        # Preallocated scratch buffers so register access never allocates -
+        # per instance, so two gauges on one bus can't clobber each other
+        self._addr1 = bytearray(1)
+        self._buf2 = bytearray(2)
+        self._buf3 = bytearray(3)
+        self._sample_buf = bytearray(26)  # registers 0x02..0x1B
+        self._last_sample = None
+        self._last_vcell = 0
+        self._last_soc = 0
+        self._last_crate = 0
+        self._status_cache = 0
+        self._status_stamp = None
+
+        # Both ID registers are immutable for a given chip, so read them
+        # once here and let the properties return the stored values
+        self._chip_version = self._read_u16(_MAX1704X_VERSION_REG)
+        if self._chip_version & 0xFFF0 != 0x0010:
             raise RuntimeError("Failed to find MAX1704X - check your wiring!")
+        self._chip_id = self._read_u8(_MAX1704X_CHIPID_REG)
         self.reset()
         self.enable_sleep = False
         self.sleep = False
 
+    # Raw register helpers - one I2C transaction each, no per-call allocation
+
+    def _read_u8(self, register: int) -> int:
+        self._addr1[0] = register
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._addr1, self._buf2, in_end=1)
+        return self._buf2[0]
+
+    def _read_u16(self, register: int) -> int:
+        self._addr1[0] = register
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._addr1, self._buf2)
+        return (self._buf2[0] << 8) | self._buf2[1]
+
+    def _write_u8(self, register: int, value: int) -> None:
+        self._buf2[0] = register
+        self._buf2[1] = value & 0xFF
+        with self.i2c_device as i2c:
+            i2c.write(self._buf2)
+
+    def _write_u16(self, register: int, value: int) -> None:
+        self._buf3[0] = register
+        self._buf3[1] = (value >> 8) & 0xFF
+        self._buf3[2] = value & 0xFF
+        with self.i2c_device as i2c:
+            i2c.write(self._buf3)
+
+    def _status_read(self) -> int:
+        self._status_cache = self._read_u8(_MAX1704X_STATUS_REG)
+        self._status_stamp = time.monotonic()
+        return self._status_cache
+
+    def _status_flags(self) -> int:
+        # Serve the STATUS bits from the cached copy while it's fresh, so a
+        # loop that samples once then tests several alert bits never goes
+        # back out on the bus for each bit
+        if self._status_stamp is not None and (
+            time.monotonic() - self._status_stamp < _MAX1704X_SAMPLE_TTL
+        ):
+            return self._status_cache
+        return self._status_read()
+
+    def _set_status_bit(self, mask: int, value: bool) -> None:
+        # Modify a fresh-or-recently-read STATUS value: right after
+        # sample()/poll_alerts() this is a single write, while on a cold or
+        # stale cache _status_flags() re-reads first so bits the chip set in
+        # the meantime are preserved, like a read-modify-write would
+        status = self._status_flags()
+        if value:
+            status |= mask
+        else:
+            status &= ~mask
+        self._status_cache = status
+        self._write_u8(_MAX1704X_STATUS_REG, status)
+
+    def _set_mode_bit(self, mask: int, value: bool) -> None:
+        mode = self._read_u8(_MAX1704X_MODE_REG)
+        if value:
+            mode |= mask
+        else:
+            mode &= ~mask
+        self._write_u8(_MAX1704X_MODE_REG, mode)
+
     def reset(self) -> None:
         """Perform a soft reset of the chip"""
         try:
-            self._cmd = 0x5400
+            self._write_u16(_MAX1704X_CMD_REG, 0x5400)
         except OSError:
             # aha! we NACKed, which is CORRECT!
             pass
         else:
             raise RuntimeError("Reset did not succeed")
-        for _ in range(3):
+        try:
+            self.reset_alert = False  # clean up RI alert
+            return
+        except OSError:
+            # With CircuitPython 8.0.0-beta.6 and ESP32-S3, the first
+            # attempt to reset the alert fails - retry below.
+            pass
+        for _ in range(2):
             try:
-                self.reset_alert = False  # clean up RI alert
+                self.reset_alert = False
                 return
             except OSError:
-                # With CircuitPython 8.0.0-beta.6 and ESP32-S3, the first
-                # attempt to reset the alert fails.
                 continue
         raise RuntimeError("Clearing reset alert did not succeed")
 
+    def sample(self) -> None:
+        """Read all of the measurement and alert registers in one burst.
+
+        The MAX1704x auto-increments its register pointer, so a single I2C
+        transaction can snapshot registers 0x02 through 0x1B (VCELL, SOC,
+        MODE, VERSION, HIBRT, CONFIG, VALERT, CRATE, VRESET/ID and STATUS)
+        instead of issuing a separate read per property. For the following
+        :const:`_MAX1704X_SAMPLE_TTL` seconds, :py:attr:`cell_voltage`,
+        :py:attr:`cell_percent`, :py:attr:`charge_rate` and
+        :py:attr:`alert_reason` return values from this snapshot without
+        touching the bus again.
+        """
+        self._addr1[0] = _MAX1704X_VCELL_REG
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._addr1, self._sample_buf)
+        self._last_vcell = struct.unpack_from(">H", self._sample_buf, 0)[0]
+        self._last_soc = struct.unpack_from(">H", self._sample_buf, 2)[0]
+        self._last_crate = struct.unpack_from(">h", self._sample_buf, 20)[0]
+        self._status_cache = self._sample_buf[24]
+        self._last_sample = time.monotonic()
+        self._status_stamp = self._last_sample
+
+    def _sample_fresh(self) -> bool:
+        return (
+            self._last_sample is not None
+            and time.monotonic() - self._last_sample < _MAX1704X_SAMPLE_TTL
+        )
+
+    @property
+    def chip_version(self) -> int:
+        """The production version of the chip, read once at init"""
+        return self._chip_version
+
+    @property
+    def chip_id(self) -> int:
+        """The 8-bit OTP-programmed chip identifier, read once at init"""
+        return self._chip_id
+
+    @property
+    def sleep(self) -> bool:
+        """Whether the chip is in sleep mode - all operations halted"""
+        return bool(self._read_u16(_MAX1704X_CONFIG_REG) & _MAX1704X_CONFIG_SLEEP)
+
+    @sleep.setter
+    def sleep(self, value: bool) -> None:
+        config = self._read_u16(_MAX1704X_CONFIG_REG)
+        if value:
+            config |= _MAX1704X_CONFIG_SLEEP
+        else:
+            config &= ~_MAX1704X_CONFIG_SLEEP
+        self._write_u16(_MAX1704X_CONFIG_REG, config)
+
+    @property
+    def enable_sleep(self) -> bool:
+        """Whether sleep mode can be entered by setting :py:attr:`sleep`"""
+        return bool(self._read_u8(_MAX1704X_MODE_REG) & _MAX1704X_MODE_ENSLEEP)
+
+    @enable_sleep.setter
+    def enable_sleep(self, value: bool) -> None:
+        self._set_mode_bit(_MAX1704X_MODE_ENSLEEP, value)
+
+    @property
+    def hibernating(self) -> bool:
+        """Whether the chip is currently in hibernation mode"""
+        return bool(self._read_u8(_MAX1704X_MODE_REG) & _MAX1704X_MODE_HIBSTAT)
+
+    @property
+    def quick_start(self) -> bool:
+        """Restart the fuel-gauge calculations, as if the battery was just inserted"""
+        return bool(self._read_u8(_MAX1704X_MODE_REG) & _MAX1704X_MODE_QUICKSTART)
+
+    @quick_start.setter
+    def quick_start(self, value: bool) -> None:
+        self._set_mode_bit(_MAX1704X_MODE_QUICKSTART, value)
+
     @property
     def cell_voltage(self) -> float:
         """The state of charge of the battery, in volts"""
-        return self._cell_voltage * 78.125 / 1_000_000
+        if self._sample_fresh():
+            return self._last_vcell * _MAX1704X_VCELL_LSB
+        return self._read_u16(_MAX1704X_VCELL_REG) * _MAX1704X_VCELL_LSB
 
     @property
     def cell_percent(self) -> float:
         """The state of charge of the battery, in percentage of 'fullness'"""
-        return self._cell_SOC / 256.0
+        if self._sample_fresh():
+            return self._last_soc / 256.0
+        return self._read_u16(_MAX1704X_SOC_REG) / 256.0
 
     @property
     def charge_rate(self) -> float:
         """Charge or discharge rate of the battery in percent/hour"""
-        return self._cell_crate * 0.208
+        if self._sample_fresh():
+            return self._last_crate * _MAX1704X_CRATE_LSB
+        raw_crate = self._read_u16(_MAX1704X_CRATE_REG)
+        if raw_crate & 0x8000:  # two's-complement 16-bit value
+            raw_crate -= 0x10000
+        return raw_crate * _MAX1704X_CRATE_LSB
 
     @property
     def reset_voltage(self) -> float:
         """The voltage that will determine whether the chip will consider it a reset/swap"""
-        return self._reset_voltage * 0.04  # 40mV / LSB
+        return (
+            (self._read_u8(_MAX1704X_VRESET_REG) >> 1) & 0x7F
+        ) * _MAX1704X_VRESET_LSB
 
     @reset_voltage.setter
     def reset_voltage(self, reset_v: float) -> None:
-        if not 0 <= reset_v <= (127 * 0.04):
+        if not 0 <= reset_v <= _MAX1704X_VRESET_MAX:
             raise ValueError("Reset voltage must be between 0 and 5.1 Volts")
-        self._reset_voltage = int(reset_v / 0.04)  # 40mV / LSB
+        vreset = self._read_u8(_MAX1704X_VRESET_REG) & _MAX1704X_VRESET_DIS
+        vreset |= _quantize(int(reset_v * 256.0), _MAX1704X_INV_VRESET_LSB_Q8) << 1
+        self._write_u8(_MAX1704X_VRESET_REG, vreset)
+
+    @property
+    def comparator_disabled(self) -> bool:
+        """Whether the analog reset-detection comparator is disabled to save power"""
+        return bool(self._read_u8(_MAX1704X_VRESET_REG) & _MAX1704X_VRESET_DIS)
+
+    @comparator_disabled.setter
+    def comparator_disabled(self, value: bool) -> None:
+        vreset = self._read_u8(_MAX1704X_VRESET_REG)
+        if value:
+            vreset |= _MAX1704X_VRESET_DIS
+        else:
+            vreset &= ~_MAX1704X_VRESET_DIS
+        self._write_u8(_MAX1704X_VRESET_REG, vreset)
 
     @property
     def voltage_alert_min(self) -> float:
         """The lower-limit voltage for the voltage alert"""
-        return self._valrt_min * 0.02  # 20mV / LSB
+        return self._read_u8(_MAX1704X_VALERT_REG) * _MAX1704X_VALRT_LSB
 
     @voltage_alert_min.setter
     def voltage_alert_min(self, minvoltage: float) -> None:
-        if not 0 <= minvoltage <= (255 * 0.02):
+        if not 0 <= minvoltage <= _MAX1704X_VALRT_MAX:
             raise ValueError("Alert voltage must be between 0 and 5.1 Volts")
-        self._valrt_min = int(minvoltage / 0.02)  # 20mV / LSB
+        self._write_u8(
+            _MAX1704X_VALERT_REG,
+            _quantize(int(minvoltage * 256.0), _MAX1704X_INV_VALRT_LSB_Q8),
+        )
 
     @property
     def voltage_alert_max(self) -> float:
         """The upper-limit voltage for the voltage alert"""
-        return self._valrt_max * 0.02  # 20mV / LSB
+        return self._read_u8(_MAX1704X_VALERT_REG + 1) * _MAX1704X_VALRT_LSB
 
     @voltage_alert_max.setter
     def voltage_alert_max(self, maxvoltage: float) -> None:
-        if not 0 <= maxvoltage <= (255 * 0.02):
+        if not 0 <= maxvoltage <= _MAX1704X_VALRT_MAX:
             raise ValueError("Alert voltage must be between 0 and 5.1 Volts")
-        self._valrt_max = int(maxvoltage / 0.02)  # 20mV / LSB
+        self._write_u8(
+            _MAX1704X_VALERT_REG + 1,
+            _quantize(int(maxvoltage * 256.0), _MAX1704X_INV_VALRT_LSB_Q8),
+        )
 
     @property
     def active_alert(self) -> bool:
         """Whether there is an active alert to be checked"""
-        return self._alert_status
+        return bool(self._read_u16(_MAX1704X_CONFIG_REG) & _MAX1704X_CONFIG_ALERT)
 
     @property
     def alert_reason(self) -> int:
-        """The 7 bits of alert-status that can be checked at once for flags"""
-        return self._status & 0x3F
+        """The 7 bits of alert-status that can be checked at once for flags
+
+        Served from the STATUS value cached by the last read, which may
+        be up to 0.5 seconds old - like the :py:meth:`sample` snapshot.
+        Call :py:meth:`poll_alerts` first to force a fresh read.
+        """
+        return self._status_flags() & 0x3F
+
+    def poll_alerts(self) -> int:
+        """Read STATUS once and return the active ``ALERTFLAG_*`` flags.
+
+        Returns 0 when no alert is pending, so checking for alerts and then
+        testing the individual flags costs a single I2C read - there is no
+        need to consult :py:attr:`active_alert` first. Also refreshes the
+        cached STATUS value used by :py:attr:`clear_alerts`.
+        """
+        return self._status_read() & 0x3F
+
+    def clear_alerts(self, mask: int = 0x3F) -> None:
+        """Clear the given ``ALERTFLAG_*`` alert flags in a single write.
+
+        :param mask: bitwise OR of the ``ALERTFLAG_*`` constants to clear,
+            typically the value returned by :py:attr:`alert_reason`.
+            Defaults to clearing all six alert flags.
+        """
+        self._status_cache = self._status_flags() & ~(mask & 0x3F)
+        self._write_u8(_MAX1704X_STATUS_REG, self._status_cache)
+
+    @property
+    def reset_alert(self) -> bool:
+        """Whether the chip has been reset or power-cycled since the last clear
+
+        Served from the STATUS value cached by the last read, which may
+        be up to 0.5 seconds old - like the :py:meth:`sample` snapshot.
+        Call :py:meth:`poll_alerts` first to force a fresh read.
+        """
+        return bool(self._status_flags() & ALERTFLAG_RESET_INDICATOR)
+
+    @reset_alert.setter
+    def reset_alert(self, value: bool) -> None:
+        self._set_status_bit(ALERTFLAG_RESET_INDICATOR, value)
+
+    @property
+    def voltage_high_alert(self) -> bool:
+        """Whether the cell voltage went above :py:attr:`voltage_alert_max`
+
+        Served from the STATUS value cached by the last read, which may
+        be up to 0.5 seconds old - like the :py:meth:`sample` snapshot.
+        Call :py:meth:`poll_alerts` first to force a fresh read.
+        """
+        return bool(self._status_flags() & ALERTFLAG_VOLTAGE_HIGH)
+
+    @voltage_high_alert.setter
+    def voltage_high_alert(self, value: bool) -> None:
+        self._set_status_bit(ALERTFLAG_VOLTAGE_HIGH, value)
+
+    @property
+    def voltage_low_alert(self) -> bool:
+        """Whether the cell voltage went below :py:attr:`voltage_alert_min`
+
+        Served from the STATUS value cached by the last read, which may
+        be up to 0.5 seconds old - like the :py:meth:`sample` snapshot.
+        Call :py:meth:`poll_alerts` first to force a fresh read.
+        """
+        return bool(self._status_flags() & ALERTFLAG_VOLTAGE_LOW)
+
+    @voltage_low_alert.setter
+    def voltage_low_alert(self, value: bool) -> None:
+        self._set_status_bit(ALERTFLAG_VOLTAGE_LOW, value)
+
+    @property
+    def voltage_reset_alert(self) -> bool:
+        """Whether the cell voltage dipped below :py:attr:`reset_voltage`
+
+        Served from the STATUS value cached by the last read, which may
+        be up to 0.5 seconds old - like the :py:meth:`sample` snapshot.
+        Call :py:meth:`poll_alerts` first to force a fresh read.
+        """
+        return bool(self._status_flags() & ALERTFLAG_VOLTAGE_RESET)
+
+    @voltage_reset_alert.setter
+    def voltage_reset_alert(self, value: bool) -> None:
+        self._set_status_bit(ALERTFLAG_VOLTAGE_RESET, value)
+
+    @property
+    def SOC_low_alert(self) -> bool:  # pylint: disable=invalid-name
+        """Whether the state of charge went below the alert threshold
+
+        Served from the STATUS value cached by the last read, which may
+        be up to 0.5 seconds old - like the :py:meth:`sample` snapshot.
+        Call :py:meth:`poll_alerts` first to force a fresh read.
+        """
+        return bool(self._status_flags() & ALERTFLAG_SOC_LOW)
+
+    @SOC_low_alert.setter
+    def SOC_low_alert(self, value: bool) -> None:  # pylint: disable=invalid-name
+        self._set_status_bit(ALERTFLAG_SOC_LOW, value)
+
+    @property
+    def SOC_change_alert(self) -> bool:  # pylint: disable=invalid-name
+        """Whether the state of charge changed by at least 1%
+
+        Served from the STATUS value cached by the last read, which may
+        be up to 0.5 seconds old - like the :py:meth:`sample` snapshot.
+        Call :py:meth:`poll_alerts` first to force a fresh read.
+        """
+        return bool(self._status_flags() & ALERTFLAG_SOC_CHANGE)
+
+    @SOC_change_alert.setter
+    def SOC_change_alert(self, value: bool) -> None:  # pylint: disable=invalid-name
+        self._set_status_bit(ALERTFLAG_SOC_CHANGE, value)
 
     @property
     def activity_threshold(self) -> float:
         """The absolute change in battery voltage that will trigger hibernation"""
-        return self._hibrt_actthr * 0.00125  # 1.25mV per LSB
+        return self._read_u8(_MAX1704X_HIBRT_REG + 1) * _MAX1704X_ACTTHR_LSB
 
     @activity_threshold.setter
     def activity_threshold(self, threshold_voltage: float) -> None:
-        if not 0 <= threshold_voltage <= (255 * 0.00125):
+        if not 0 <= threshold_voltage <= _MAX1704X_ACTTHR_MAX:
             raise ValueError(
                 "Activity voltage change must be between 0 and 0.31875 Volts"
             )
-        self._hibrt_actthr = int(threshold_voltage / 0.00125)  # 1.25mV per LSB
+        self._write_u8(
+            _MAX1704X_HIBRT_REG + 1,
+            _quantize(int(threshold_voltage * 4096.0), _MAX1704X_INV_ACTTHR_LSB_Q4),
+        )
 
     @property
     def hibernation_threshold(self) -> float:
         """The absolute-value percent-per-hour change in charge rate
         that will trigger hibernation"""
-        return self._hibrt_hibthr * 0.208  # 0.208% per hour
+        return self._read_u8(_MAX1704X_HIBRT_REG) * _MAX1704X_HIBTHR_LSB
 
     @hibernation_threshold.setter
     def hibernation_threshold(self, threshold_percent: float) -> None:
-        if not 0 <= threshold_percent <= (255 * 0.208):
+        if not 0 <= threshold_percent <= _MAX1704X_HIBTHR_MAX:
             raise ValueError(
                 "Activity percentage/hour change must be between 0 and 53%"
             )
-        self._hibrt_hibthr = int(threshold_percent / 0.208)  # 0.208% per hour
+        self._write_u8(
+            _MAX1704X_HIBRT_REG,
+            _quantize(int(threshold_percent * 64.0), _MAX1704X_INV_HIBTHR_LSB_Q10),
+        )
 
     def hibernate(self) -> None:
         """Setup thresholds for hibernation to go into hibernation mode immediately.
@@ -227,8 +542,7 @@ class MAX17048:
         Can check status with :py:attr:`hibernating`
         """
 
-        self._hibrt_hibthr = 0xFF
-        self._hibrt_actthr = 0xFF
+        self._write_u16(_MAX1704X_HIBRT_REG, 0xFFFF)
 
     def wake(self) -> None:
         """Setup thresholds for hibernation to leave hibernation mode immediately.
@@ -238,5 +552,4 @@ class MAX17048:
         Can check status with :py:attr:`hibernating`
         """
 
-        self._hibrt_hibthr = 0
-        self._hibrt_actthr = 0
+        self._write_u16(_MAX1704X_HIBRT_REG, 0x0000)
@@ -58,6 +58,7 @@ print("Voltage alert maximum = %0.2f V" % max17.voltage_alert_max)
 
 print("")
 while True:
+    max17.sample()  # one burst read covers all the properties below
     print(f"Battery voltage: {max17.cell_voltage:.2f} Volts")
     print(f"Battery state  : {max17.cell_percent:.1f} %")
 
@@ -65,30 +66,27 @@ while True:
     if max17.hibernating:
         print("Hibernating!")
 
-    if max17.active_alert:
+    flags = max17.alert_reason
+    if flags:
         print("Alert!")
-        if max17.reset_alert:
+        if flags & adafruit_max1704x.ALERTFLAG_RESET_INDICATOR:
             print("  Reset indicator")
-            max17.reset_alert = False  # clear the alert
 
-        if max17.voltage_high_alert:
+        if flags & adafruit_max1704x.ALERTFLAG_VOLTAGE_HIGH:
             print("  Voltage high")
-            max17.voltage_high_alert = False  # clear the alert
 
-        if max17.voltage_low_alert:
+        if flags & adafruit_max1704x.ALERTFLAG_VOLTAGE_LOW:
             print("  Voltage low")
-            max17.voltage_low_alert = False  # clear the alert
 
-        if max17.voltage_reset_alert:
+        if flags & adafruit_max1704x.ALERTFLAG_VOLTAGE_RESET:
             print("  Voltage reset")
-            max17.voltage_reset_alert = False  # clear the alert
 
-        if max17.SOC_low_alert:
+        if flags & adafruit_max1704x.ALERTFLAG_SOC_LOW:
             print("  Charge low")
-            max17.SOC_low_alert = False  # clear the alert
 
-        if max17.SOC_change_alert:
+        if flags & adafruit_max1704x.ALERTFLAG_SOC_CHANGE:
             print("  Charge changed")
-            max17.SOC_change_alert = False  # clear the alert
+
+        max17.clear_alerts(flags)  # clear all the handled alerts in one write
     print("")
     time.sleep(1)
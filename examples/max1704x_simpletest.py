@@ -24,6 +24,7 @@ print(
 # max17.quick_start = True
 
 while True:
+    max17.sample()  # one burst read covers all the properties below
     print(f"Battery voltage: {max17.cell_voltage:.2f} Volts")
     print(f"Battery state  : {max17.cell_percent:.1f} %")
     print("")